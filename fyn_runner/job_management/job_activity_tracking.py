@@ -199,14 +199,9 @@ class ActiveJobTracker:
         """
 
         with self._lock:
-            removed = False
-            if job_id in self._active_jobs:
-                del self._active_jobs[job_id]
-                removed = True
-            if job_id in self._completed_jobs:
-                del self._completed_jobs[job_id]
-                removed = True
-            return removed
+            removed_active = self._active_jobs.pop(job_id, None) is not None
+            removed_completed = self._completed_jobs.pop(job_id, None) is not None
+            return removed_active or removed_completed
 
     def get_active_job_ids(self):
         """Get list of active job IDs.
@@ -236,8 +236,8 @@ class JobManager:
             self._pending_queue.task_done()  # must clear the queue (it is done) -> re-adds below.
 
             # Clean up thread if created but not started
-            if thread and job_info.id in self._observer_threads:
-                del self._observer_threads[job_info.id]
+            if thread:
+                self._observer_threads.pop(job_info.id, None)
 
             # Ensure server re-queues
             try:
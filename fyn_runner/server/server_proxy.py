@@ -11,12 +11,16 @@
 # You should have received a copy of the GNU General Public License along with this program. If not,
 #  see <https://www.gnu.org/licenses/>.
 
-import atexit
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import random
 import threading
 import time
+import weakref
+import orjson
 import requests
-from websocket import WebSocketApp
+from urllib3.util.retry import Retry
+from websocket import ABNF, WebSocketApp
 
 import fyn_api_client as fac
 
@@ -42,18 +46,61 @@ class ServerProxy:
         token (str): Authentication token for API requests.
     """
 
-    def __init__(self, logger, file_manager, configuration):
+    __slots__ = (
+        'logger', 'file_manager', 'name', 'id', 'token', 'report_interval', 'api_config',
+        '_running', '_api_client', '_runner_api', '_status_requests', '_observers',
+        '_observers_lock', '_callback_pool', '_callback_slots', '_ws', '_ws_header',
+        '_ws_connected', '_ws_opened_at', '_ws_thread', '_ws_reconnect_attempts',
+        '_ws_send_lock', '_ws_send_failures', '_ws_send_blocked_until', '_finalizer',
+        '__weakref__',
+    )
+
+    # WebSocket reconnect backoff: base * 2^attempt seconds, capped, with +/- jitter fraction.
+    # The backoff only resets once a connection has stayed open for _RECONNECT_RESET_AFTER seconds,
+    # so a server which accepts then immediately drops the connection is not hammered.
+    _RECONNECT_BASE_DELAY = 0.5
+    _RECONNECT_MAX_DELAY = 15.0
+    _RECONNECT_JITTER = 0.25
+    _RECONNECT_RESET_AFTER = 30.0
+
+    # WebSocket send circuit breaker: consecutive failures to trip, and seconds to stay open.
+    _SEND_BREAKER_THRESHOLD = 5
+    _SEND_BREAKER_COOLDOWN = 60.0
+    _DROPPED_RESPONSE = "Dropped response to message %s: WebSocket sends paused after failures"
+
+    # Worker threads running observer callbacks, so a slow observer cannot stall the receive loop.
+    # Callbacks queued or running are capped; when full the receive loop waits (applying TCP
+    # backpressure to the server) up to the timeout, then rejects the message.
+    _CALLBACK_WORKERS = 4
+    _MAX_PENDING_CALLBACKS = 64
+    _CALLBACK_SLOT_TIMEOUT = 10.0
+    _ERR_BUSY = "Runner busy: too many messages pending, message rejected."
+
+    # Fixed WebSocket response scaffolding, filled with orjson-encoded values via '%'.
+    _SUCCESS_TEMPLATE = b'{"type":"success","response_to":%s}'
+    _ERROR_TEMPLATE = b'{"type":"error","response_to":%s,"data":%s}'
+    _ERR_MISSING_TYPE = "Websocket messages must contain a 'type' field."
+    _ERR_NOT_CONNECTED = "Cannot send error response: WebSocket not connected"
+    _RESPONSE_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    # Retry policy for the pooled REST connections shared by every API created by this proxy.
+    # urllib3 already retries 3 times by default; this adds an exponential backoff between attempts.
+    _HTTP_RETRIES = Retry(total=3, backoff_factor=0.2)
+
+    def __init__(self, logger, file_manager, configuration, *, thread_factory=threading.Thread):
         """Initialize the ServerProxy with backend communication capabilities.
 
         Sets up REST API client configuration, initializes WebSocket connection, and starts the
-        background WebSocket handler thread. Automatically reports initial status and registers
-        cleanup handler.
+        background WebSocket handler thread. Automatically reports initial status and registers a
+        finalizer which reports the runner offline at interpreter exit.
 
         Args:
             logger: Logger instance for debugging and error reporting.
             file_manager: File manager instance (injected dependency).
             configuration: Configuration object containing runner details.
                 Must have attributes: name, id, token, report_interval.
+            thread_factory (callable, optional): Factory used to create the WebSocket handler
+                thread. Defaults to threading.Thread.
 
         Raises:
             Exception: If API client configuration fails.
@@ -73,29 +120,66 @@ class ServerProxy:
         logger.warning("report_interval not used, wip.")
 
         # Proxy Status
-        self.running: bool = True
+        self._running: bool = True
 
         # HTTP message handing and related
         self._api_client = self._configure_client_api()
         self._runner_api = self.create_runner_manager_api()
+        self._status_requests = {state: fac.PatchedRunnerInfoRequest(state=state)
+                                 for state in fac.StateEnum}
 
         # Websocket message handling and related
-        self._observers = {}
+        self._observers = {}  # copy-on-write, rebound under _observers_lock by (de)register
         self._observers_lock = threading.RLock()
-        self._ws: WebSocketApp = None  # only the _ws_thread should access
+        self._callback_pool = ThreadPoolExecutor(max_workers=self._CALLBACK_WORKERS,
+                                                 thread_name_prefix="ws-callback")
+        self._callback_slots = threading.BoundedSemaphore(self._MAX_PENDING_CALLBACKS)
+        self._ws: WebSocketApp = None  # (re)created by _ws_thread, also sent on by callback threads
+        self._ws_header = {'token': self.token}
         self._ws_connected: bool = False
-        self._ws_thread: threading.Thread = threading.Thread(target=self._receive_handler)
-        self._ws_thread.daemon = True
+        self._ws_opened_at: float = None
+        self._ws_reconnect_attempts: int = 0
+        self._ws_send_lock = threading.Lock()  # guards the send breaker state below
+        self._ws_send_failures: int = 0
+        self._ws_send_blocked_until: float = 0.0
+        self._ws_thread: threading.Thread = thread_factory(target=self._receive_handler,
+                                                           daemon=True)
 
         # initialisation procedure
         self._report_status(fac.StateEnum.ID)
-        atexit.register(self._report_status, fac.StateEnum.OF)
+        self._finalizer = weakref.finalize(self, ServerProxy._cleanup, self.logger,
+                                           self._runner_api, self.id,
+                                           self._status_requests[fac.StateEnum.OF])
         self._ws_thread.start()
 
     # ----------------------------------------------------------------------------------------------
     #  Server Proxy Interface
     # ----------------------------------------------------------------------------------------------
 
+    @property
+    def running(self):
+        """Whether the proxy should continue operating."""
+        return self._running
+
+    @running.setter
+    def running(self, value):
+        """Set whether the proxy should continue operating, shutting it down when cleared.
+
+        Clearing the flag cancels queued observer callbacks and closes the WebSocket. This must
+        happen before the process exits: the callback pool's worker threads are joined before
+        atexit handlers and finalizers run, so queued callbacks would otherwise delay exit (and
+        the offline status report) until they had all run. Callbacks already executing still run
+        to completion.
+
+        Args:
+            value (bool): False to stop the proxy.
+        """
+        self._running = value
+        if not value:
+            self._callback_pool.shutdown(wait=False, cancel_futures=True)
+            if self._ws:
+                self._ws.close()
+
     def create_application_registry_api(self):
         """Create and return an ApplicationRegistryApi client instance.
 
@@ -109,7 +193,7 @@ class ServerProxy:
         try:
             job_api = fac.ApplicationRegistryApi(self._api_client)
         except Exception as e:
-            self.logger.error(f"Error while configuring the client api: {str(e)}")
+            self.logger.error("Error while configuring the client api: %s", e)
             raise RuntimeError(f"Error while configuring the client api: {str(e)}") from e
         return job_api
 
@@ -125,7 +209,7 @@ class ServerProxy:
         try:
             job_api = fac.JobManagerApi(self._api_client)
         except Exception as e:
-            self.logger.error(f"Error while configuring the client api: {str(e)}")
+            self.logger.error("Error while configuring the client api: %s", e)
             raise RuntimeError(f"Error while configuring the client api: {str(e)}") from e
         return job_api
 
@@ -141,7 +225,7 @@ class ServerProxy:
         try:
             runner_api = fac.RunnerManagerApi(self._api_client)
         except Exception as e:
-            self.logger.error(f"Error while configuring the client api: {str(e)}")
+            self.logger.error("Error while configuring the client api: %s", e)
             raise RuntimeError(f"Error while configuring the client api: {str(e)}") from e
         return runner_api
 
@@ -154,17 +238,19 @@ class ServerProxy:
         Args:
             message_type (str): The type of message to observe.
             call_back (callable): Function to call when message is received. Should accept a message
-                dict parameter and return an optional response dict.
+                dict parameter and return an optional response dict. The response is serialised
+                with orjson, so it may contain dataclasses, datetimes and numpy arrays directly.
 
         Raises:
             RuntimeError: If an observer is already registered for this message type.
         """
         with self._observers_lock:
-            if message_type not in self._observers:
-                self._observers[message_type] = call_back
-                self.logger.info(f"Registered observer {message_type}")
-            else:
+            if message_type in self._observers:
                 raise RuntimeError(f"Trying to add to existing observer {message_type}")
+            observers = dict(self._observers)
+            observers[message_type] = call_back
+            self._observers = observers
+            self.logger.info("Registered observer %s", message_type)
 
     def deregister_observer(self, message_type):
         """Remove a previously registered observer for the specified message type.
@@ -176,11 +262,11 @@ class ServerProxy:
             RuntimeError: If no observer is registered for this message type.
         """
         with self._observers_lock:
-            if message_type in self._observers:
-                del self._observers[message_type]
-                self.logger.info(f"Deregistered observer {message_type}")
-            else:
+            observers = dict(self._observers)
+            if observers.pop(message_type, None) is None:
                 raise RuntimeError(f"Trying to remove non-existant observer {message_type}")
+            self._observers = observers
+            self.logger.info("Deregistered observer %s", message_type)
 
     # ----------------------------------------------------------------------------------------------
     #  Internal Backend HTTP Reporting Methods
@@ -189,6 +275,9 @@ class ServerProxy:
     def _configure_client_api(self):
         """Configure and return the base API client with authentication.
 
+        The client owns a single urllib3 connection pool (keep-alive), which is shared by every API
+        instance created through this proxy, so it is configured once here with a retry policy.
+
         Returns:
             fyn_api_client.ApiClient: Configured API client with authorization header.
 
@@ -196,10 +285,11 @@ class ServerProxy:
             Exception: If API client configuration fails.
         """
         try:
+            self.api_config.retries = self._HTTP_RETRIES
             api_client = fac.ApiClient(self.api_config)
             api_client.set_default_header("Authorization", f"Token {str(self.token)}")
         except Exception as e:
-            self.logger.error(f"Error while configuring the client api: {str(e)}")
+            self.logger.error("Error while configuring the client api: %s", e)
             raise RuntimeError(f"Error while configuring the client api: {str(e)}") from e
         return api_client
 
@@ -214,16 +304,42 @@ class ServerProxy:
             ConnectionError: If the HTTP request to report status fails.
         """
 
-        self.logger.debug(f"Reporting status {status.value}")
+        self.logger.debug("Reporting status %s", status.value)
         try:
             self._runner_api.runner_manager_runner_partial_update(
                 id=self.id,
-                patched_runner_info_request=fac.PatchedRunnerInfoRequest(state=status),
+                patched_runner_info_request=self._status_requests[status],
             )
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to report status '{status}': {str(e)}")
+            self.logger.error("Failed to report status '%s': %s", status, e)
             raise ConnectionError(f"Failed to report status '{status}': {str(e)}") from e
 
+    @staticmethod
+    def _cleanup(logger, runner_api, runner_id, offline_request):
+        """Report the runner offline.
+
+        Run once by the proxy's weakref finalizer. The started _ws_thread holds a reference to the
+        proxy until the process ends, so in practice this only runs at interpreter exit, i.e. the
+        finalizer acts as an atexit hook. It is static and only given what it needs, so the
+        finalizer itself holds no reference to the proxy. Stopping the callback pool is left to
+        the running setter, as the pool's workers are joined before finalizers run.
+
+        Args:
+            logger: Logger instance for debugging and error reporting.
+            runner_api (fyn_api_client.RunnerManagerApi): API used to report the status.
+            runner_id (str): Runner ID for backend identification.
+            offline_request (fyn_api_client.PatchedRunnerInfoRequest): The offline status request.
+        """
+
+        logger.debug("Reporting status %s", offline_request.state.value)
+        try:
+            runner_api.runner_manager_runner_partial_update(
+                id=runner_id,
+                patched_runner_info_request=offline_request,
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to report status '%s': %s", offline_request.state, e)
+
     # ----------------------------------------------------------------------------------------------
     #  Internal Web Socket Methods
     # ----------------------------------------------------------------------------------------------
@@ -233,91 +349,167 @@ class ServerProxy:
 
         Runs in a separate daemon thread and handles:
         - Establishing WebSocket connection to the backend
-        - Automatic reconnection on connection loss
+        - Automatic reconnection on connection loss, with jittered exponential backoff
         - WebSocket error handling and recovery
 
         Continues attempting connection until self.running is set to False.
         """
 
-        [protocol, url, port] = self.api_config.host.split(":")
-        protocol = "ws:" if protocol == "http" else "wss:"
-        ws_url = f"{protocol}{url}:{port}/ws/runner_manager/{self.id}"
-        self.logger.debug(f"Starting WebSocket on {ws_url}")
+        ws_url = self._build_ws_url()
+        self.logger.debug("Starting WebSocket on %s", ws_url)
 
         while self.running:
-            try:
-                self._ws = WebSocketApp(
-                    ws_url,
-                    header={'token': f'{self.token}'},
-                    on_message=self._handle_ws_message,
-                    on_open=self._on_ws_open,
-                    on_close=self._on_ws_close,
-                    on_error=self._on_ws_error
-                )
-
-                self._ws.run_forever()
-
-                if self.running:
-                    self.logger.warning("WebSocket disconnected, reconnecting...")
-                    time.sleep(5)
-            except Exception as e:
-                self.logger.error(f"WebSocket error: {e}")
-                time.sleep(5)
+            self._run_ws_once(ws_url)
+
+    def _run_ws_once(self, ws_url):
+        """Run one WebSocket connection until it closes, backing off before any reconnect.
+
+        Args:
+            ws_url (str): The WebSocket URL to connect to.
+        """
+        try:
+            self._ws = WebSocketApp(
+                ws_url,
+                header=self._ws_header,
+                on_message=self._handle_ws_message,
+                on_open=self._on_ws_open,
+                on_close=self._on_ws_close,
+                on_error=self._on_ws_error
+            )
+
+            self._ws_opened_at = None
+            self._ws.run_forever()
+
+            if (self._ws_opened_at is not None and
+                    time.monotonic() - self._ws_opened_at >= self._RECONNECT_RESET_AFTER):
+                self._ws_reconnect_attempts = 0
+
+            if self.running:
+                self.logger.warning("WebSocket disconnected, reconnecting...")
+                time.sleep(self._reconnect_delay())
+        except Exception as e:
+            self.logger.error("WebSocket error: %s", e)
+            time.sleep(self._reconnect_delay())
+
+    def _reconnect_delay(self):
+        """Return the delay before the next WebSocket reconnect attempt.
+
+        The delay grows exponentially with consecutive failed attempts, up to a cap, and is
+        randomly jittered so that many runners do not reconnect in lock-step after a server
+        restart. The attempt count is reset by _run_ws_once once a connection has stayed open for
+        _RECONNECT_RESET_AFTER seconds.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        delay = min(self._RECONNECT_MAX_DELAY,
+                    self._RECONNECT_BASE_DELAY * 2 ** self._ws_reconnect_attempts)
+        self._ws_reconnect_attempts += 1
+        return delay * random.uniform(1 - self._RECONNECT_JITTER, 1 + self._RECONNECT_JITTER)
+
+    def _build_ws_url(self):
+        """Build the runner's WebSocket URL from the REST API host.
+
+        Returns:
+            str: The ws:// (for http) or wss:// (otherwise) URL of the runner's WebSocket endpoint.
+        """
+        [protocol, url, port] = self.api_config.host.split(":")
+        protocol = "ws:" if protocol == "http" else "wss:"
+        return f"{protocol}{url}:{port}/ws/runner_manager/{self.id}"
 
     def _handle_ws_message(self, _ws, message_data):
         """Process incoming WebSocket messages and route to appropriate observers.
 
-        Parses JSON message data, validates required fields, and invokes the registered observer
-        callback for the message type. Sends response back to server.
+        Parses JSON message data, validates required fields, and submits the registered observer
+        callback for the message type to the callback pool. The response is sent back to the
+        server by _ws_callback_response once the callback completes.
 
         Args:
             _ws (WebSocketApp): The WebSocket instance that received the message.
-            message_data (str): Raw JSON message string from the server.
+            message_data (str | bytes): Raw JSON message from the server.
         """
 
-        message = json.loads(message_data)
+        message = orjson.loads(message_data)
         message_id = message.get('id')
         message_type = message.get('type')
 
         if not message_id:
-            self.logger.error(f"Received message with no id: {message}")
+            self.logger.error("Received message with no id: %s", message)
             return
 
         if not message_type:
-            self.logger.error(f"Received message {message_id} without type.")
-            self._ws_error_response(message_id,
-                                    "Websocket messages must contain a 'type' field.")
+            self.logger.error("Received message %s without type.", message_id)
+            self._ws_error_frame(message_id, self._ERR_MISSING_TYPE)
             return
 
-        self.logger.debug(f"Received WebSocket message ({message_id}) {message_type}")
+        self.logger.debug("Received WebSocket message (%s) %s", message_id, message_type)
 
-        callback = None
-        with self._observers_lock:
-            callback = self._observers.get(message_type)
+        callback = self._observers.get(message_type)
 
         if callback:
+            # The slot is released by _ws_callback_response once the callback completes.
+            # pylint: disable-next=consider-using-with
+            if not self._callback_slots.acquire(timeout=self._CALLBACK_SLOT_TIMEOUT):
+                self.logger.error("Rejected message %s %s: %s callbacks pending", message_id,
+                                  message_type, self._MAX_PENDING_CALLBACKS)
+                self._ws_error_frame(message_id, self._ERR_BUSY)
+                return
+
             try:
-                response = callback(message)
+                future = self._callback_pool.submit(callback, message)
+            except Exception:
+                self._callback_slots.release()
+                raise
+            future.add_done_callback(partial(self._ws_callback_response, message_id, message_type))
+
+        else:
+            error_msg = f"Unknown message type {message_type} for message {message_id}"
+            self.logger.error(error_msg)
+            self._ws_error_frame(message_id, error_msg)
+
+    def _ws_callback_response(self, message_id, message_type, future):
+        """Send the response of a completed observer callback back to the server.
+
+        Runs on the callback pool thread that completed the future. A falsy callback result is
+        answered with a success response, otherwise the returned dict is sent; any exception
+        raised by the callback (or the send) is answered with an error response, and a callback
+        cancelled because the proxy stopped is not answered. Frees the pending callback slot taken
+        in _handle_ws_message.
+
+        Args:
+            message_id (str): ID of the message the callback processed.
+            message_type (str): Type of the message the callback processed.
+            future (concurrent.futures.Future): The completed callback future.
+        """
+
+        try:
+            if future.cancelled():
+                self.logger.debug("Callback for message %s %s cancelled on shutdown", message_id,
+                                  message_type)
+                return
 
-                if not response:
-                    response = {'type': 'success'}
+            response = future.result()
 
+            if not response:
+                payload = self._SUCCESS_TEMPLATE % orjson.dumps(message_id)
+            else:
                 if 'id' not in response and message_id:
                     response['response_to'] = message_id
+                payload = orjson.dumps(response, option=self._RESPONSE_OPTIONS)
 
-                self._ws.send(json.dumps(response))
-                self.logger.info(f"Websocket success response for message {message_id}")
-
-            except Exception as e:
-                error_msg = f"Error while processing message{message_id} {message_type}: {e}"
-                self.logger.error(error_msg)
-                self._ws_error_response(message_id, error_msg)
+            if self._ws_send(payload):
+                self.logger.info("Websocket success response for message %s", message_id)
+            else:
+                self.logger.warning(self._DROPPED_RESPONSE, message_id)
 
-        else:
-            error_msg = f"Unknown message type {message_type} for message {message_id}"
+        except Exception as e:
+            error_msg = f"Error while processing message{message_id} {message_type}: {e}"
             self.logger.error(error_msg)
             self._ws_error_response(message_id, error_msg)
 
+        finally:
+            self._callback_slots.release()
+
     def _on_ws_open(self, _ws):
         """WebSocket connection established callback.
 
@@ -326,6 +518,10 @@ class ServerProxy:
         """
         self.logger.info("WebSocket connection established")
         self._ws_connected = True
+        self._ws_opened_at = time.monotonic()
+        with self._ws_send_lock:
+            self._ws_send_failures = 0
+            self._ws_send_blocked_until = 0.0
 
     def _on_ws_close(self, _ws, close_status_code, close_msg):
         """WebSocket connection closed callback.
@@ -335,7 +531,7 @@ class ServerProxy:
             close_status_code (int): Status code indicating why connection was closed.
             close_msg (str): Message associated with the close status.
         """
-        self.logger.info(f"WebSocket connection closed: {close_status_code} {close_msg}")
+        self.logger.info("WebSocket connection closed: %s %s", close_status_code, close_msg)
         self._ws_connected = False
 
     def _on_ws_error(self, _ws, error):
@@ -345,7 +541,7 @@ class ServerProxy:
             _ws (WebSocketApp): The WebSocket instance that encountered an error.
             error (Exception): The error that occurred.
         """
-        self.logger.error(f"WebSocket error: {error}")
+        self.logger.error("WebSocket error: %s", error)
 
     def _ws_error_response(self, message_id, data):
         """Send standardized error response via WebSocket.
@@ -359,15 +555,67 @@ class ServerProxy:
         """
 
         if self._ws and self._ws_connected:  # Check connection state
-            error_response = {
-                "type": "error",
-                "response_to": message_id,
-                "data": data
-            }
             try:
-                self._ws.send(json.dumps(error_response))
-                self.logger.debug(f"Sent error response: {error_response}")
+                self._ws_error_frame(message_id, data)
             except Exception as e:
-                self.logger.error(f"Failed to send error response: {e}")
+                self.logger.error("Failed to send error response: %s", e)
         else:
-            self.logger.error("Cannot send error response: WebSocket not connected")
+            self.logger.error(self._ERR_NOT_CONNECTED)
+
+    def _ws_error_frame(self, message_id, data):
+        """Send an error response frame without checking the connection state.
+
+        Only for use from _handle_ws_message, which websocket-client invokes on the receive thread
+        while the connection is open. Send failures propagate to websocket-client, which reports
+        them through _on_ws_error. Other callers should use _ws_error_response.
+
+        Args:
+            message_id (str): ID of the message being responded to.
+            data (str): Error message or details to include in the response.
+        """
+        error_response = self._ERROR_TEMPLATE % (orjson.dumps(message_id), orjson.dumps(data))
+        if self._ws_send(error_response):
+            self.logger.debug("Sent error response: %s", error_response)
+        else:
+            self.logger.warning(self._DROPPED_RESPONSE, message_id)
+
+    def _ws_send(self, payload):
+        """Send a payload over the WebSocket, guarded by a circuit breaker.
+
+        After _SEND_BREAKER_THRESHOLD consecutive send failures the breaker trips and sends are
+        dropped for _SEND_BREAKER_COOLDOWN seconds, bounding the CPU and log volume spent on a
+        failing socket. A successful send, or a new connection, closes the breaker again.
+
+        Called from the receive thread and the callback pool threads, so the breaker state is
+        updated under _ws_send_lock; the unlocked read of _ws_send_blocked_until may only let a
+        send through just as the breaker trips.
+
+        Args:
+            payload (bytes): The UTF-8 encoded JSON message, sent as-is in a text frame.
+
+        Returns:
+            bool: True if the payload was sent, False if it was dropped by the open breaker.
+
+        Raises:
+            Exception: Any exception raised by the underlying send.
+        """
+
+        if time.monotonic() < self._ws_send_blocked_until:
+            return False
+
+        try:
+            self._ws.send(payload, ABNF.OPCODE_TEXT)
+        except Exception:
+            with self._ws_send_lock:
+                self._ws_send_failures += 1
+                failures = self._ws_send_failures
+                if failures >= self._SEND_BREAKER_THRESHOLD:
+                    self._ws_send_blocked_until = time.monotonic() + self._SEND_BREAKER_COOLDOWN
+            if failures >= self._SEND_BREAKER_THRESHOLD:
+                self.logger.error("WebSocket send failed %s times in a row, pausing sends for %ss",
+                                  failures, self._SEND_BREAKER_COOLDOWN)
+            raise
+
+        with self._ws_send_lock:
+            self._ws_send_failures = 0
+        return True
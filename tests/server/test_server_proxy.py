@@ -13,36 +13,96 @@
 
 # pylint: disable=protected-access,pointless-statement,unspecified-encoding,import-error
 
-import atexit
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import dataclasses
+import datetime
+import gc
 import json
+import logging
 import threading
 import time
-from unittest.mock import MagicMock, patch, ANY
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+from websocket import ABNF
 
+from fyn_runner.server.config import ServerProxyConfig
 from fyn_runner.server.server_proxy import ServerProxy
+from fyn_runner.utilities.file_manager import FileManager
 import fyn_api_client as fac
 
 
+class _ImmediateExecutor(Executor):
+    """Executor running submitted work inline, so observer responses are sent synchronously."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class _TestableServerProxy(ServerProxy):
+    """ServerProxy with an instance __dict__, so tests can attach their mocks to it."""
+
+
+def _make_server_proxy(logger, file_manager, configuration):
+    """Construct a ServerProxy without starting threads or reporting status."""
+    thread_instances = []
+
+    class _NoopThread(threading.Thread):
+        """Thread which records its construction and whose start is a no-op."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.start_called = False
+            thread_instances.append(self)
+
+        def start(self):
+            self.start_called = True
+
+    # Mock API configuration and client creation
+    with (patch('fyn_api_client.Configuration') as mock_config,
+          patch('fyn_api_client.ApiClient') as mock_api_client,
+          patch('fyn_api_client.RunnerManagerApi') as mock_runner_api,
+          patch.object(ServerProxy, '_report_status') as mock_report_status):
+
+        mock_config.return_value.host = "http://localhost:8000"
+
+        proxy = _TestableServerProxy(logger, file_manager, configuration,
+                                     thread_factory=_NoopThread)
+        proxy._callback_pool = _ImmediateExecutor()
+
+        # Store mocks for later assertions
+        proxy._thread_instances = thread_instances
+        proxy._mock_report_status = mock_report_status
+        proxy._mock_api_client = mock_api_client
+        proxy._mock_runner_api = mock_runner_api
+
+    return proxy
+
+
 class TestServerProxy:
     """Test suite for ServerProxy factory and WebSocket manager."""
 
     @pytest.fixture
     def mock_logger(self):
         """Create a mock logger."""
-        return MagicMock()
+        return MagicMock(spec=logging.Logger)
 
     @pytest.fixture
     def mock_file_manager(self):
         """Create a mock file manager."""
-        return MagicMock()
+        return MagicMock(spec=FileManager)
 
     @pytest.fixture
     def mock_configuration(self):
         """Create a mock configuration."""
-        config = MagicMock()
+        config = MagicMock(spec=ServerProxyConfig)
         config.name = "test_runner"
         config.id = "test-123"
         config.token = "test-token"
@@ -52,40 +112,11 @@ class TestServerProxy:
     @pytest.fixture
     def server_proxy(self, mock_logger, mock_file_manager, mock_configuration):
         """Create a ServerProxy instance for testing."""
-        original_register = atexit.register
-        original_thread = threading.Thread
-
-        # Mock atexit.register to avoid cleanup registration
-        atexit.register = MagicMock()
-
-        # Mock threading.Thread to avoid starting actual threads
-        mock_thread = MagicMock()
-        threading.Thread = MagicMock(return_value=mock_thread)
-
-        # Mock API configuration and client creation
-        with (patch('fyn_api_client.Configuration') as mock_config,
-              patch('fyn_api_client.ApiClient') as mock_api_client,
-              patch('fyn_api_client.RunnerManagerApi') as mock_runner_api,
-              patch.object(ServerProxy, '_report_status') as mock_report_status):
-
-            mock_config.return_value.host = "http://localhost:8000"
-
-            proxy = ServerProxy(mock_logger, mock_file_manager, mock_configuration)
-
-            # Store mocks for later assertions
-            proxy._mock_thread = mock_thread
-            proxy._mock_report_status = mock_report_status
-            proxy._mock_api_client = mock_api_client
-            proxy._mock_runner_api = mock_runner_api
-
-        # Restore original functions
-        atexit.register = original_register
-        threading.Thread = original_thread
-
-        return proxy
+        return _make_server_proxy(mock_logger, mock_file_manager, mock_configuration)
 
     def test_initialization(self, server_proxy, mock_logger, mock_file_manager, mock_configuration):
         """Test ServerProxy initialization."""
+
         # Check basic attributes
         assert server_proxy.logger == mock_logger
         assert server_proxy.file_manager == mock_file_manager
@@ -105,7 +136,13 @@ class TestServerProxy:
         assert isinstance(server_proxy._observers_lock, type(threading.RLock()))
 
         # Check that background thread was started
-        server_proxy._mock_thread.start.assert_called_once()
+        assert len(server_proxy._thread_instances) == 1
+        ws_thread = server_proxy._thread_instances[0]
+        assert isinstance(ws_thread, threading.Thread)
+        assert ws_thread is server_proxy._ws_thread
+        assert ws_thread._target == server_proxy._receive_handler
+        assert ws_thread.daemon is True
+        assert ws_thread.start_called is True
 
         # Check that status was reported
         server_proxy._mock_report_status.assert_called_once_with(fac.StateEnum.ID)
@@ -185,7 +222,7 @@ class TestServerProxy:
 
         assert "test_message" in server_proxy._observers
         assert server_proxy._observers["test_message"] == mock_callback
-        server_proxy.logger.info.assert_called_with("Registered observer test_message")
+        server_proxy.logger.info.assert_called_with("Registered observer %s", "test_message")
 
     def test_register_duplicate_observer(self, server_proxy):
         """Test registering a duplicate observer raises an exception."""
@@ -202,7 +239,20 @@ class TestServerProxy:
         server_proxy.deregister_observer("test_message")
 
         assert "test_message" not in server_proxy._observers
-        server_proxy.logger.info.assert_called_with("Deregistered observer test_message")
+        server_proxy.logger.info.assert_called_with("Deregistered observer %s", "test_message")
+
+    def test_observers_copy_on_write(self, server_proxy):
+        """Test (de)registering rebinds the observers dict rather than mutating a snapshot."""
+        snapshot = server_proxy._observers
+
+        server_proxy.register_observer("test_message", MagicMock())
+        assert server_proxy._observers is not snapshot
+        assert "test_message" not in snapshot
+
+        snapshot = server_proxy._observers
+        server_proxy.deregister_observer("test_message")
+        assert server_proxy._observers is not snapshot
+        assert "test_message" in snapshot
 
     def test_deregister_nonexistent_observer(self, server_proxy):
         """Test deregistering a non-existent observer raises an exception."""
@@ -220,10 +270,23 @@ class TestServerProxy:
 
             assert result == mock_instance
             mock_api_client.assert_called_once_with(server_proxy.api_config)
+            assert server_proxy.api_config.retries is ServerProxy._HTTP_RETRIES
             mock_instance.set_default_header.assert_called_once_with(
                 "Authorization", f"Token {server_proxy.token}"
             )
 
+    def test_http_retry_policy(self):
+        """Test the REST retry policy backs off between retries, unlike urllib3's default."""
+        retries = ServerProxy._HTTP_RETRIES
+        delays = []
+        for _ in range(3):
+            retries = retries.increment(method="GET", url="/", error=ConnectTimeoutError())
+            delays.append(retries.get_backoff_time())
+
+        assert delays == [0, 0.4, 0.8]
+        with pytest.raises(MaxRetryError):
+            retries.increment(method="GET", url="/", error=ConnectTimeoutError())
+
     def test_configure_client_api_failure(self, server_proxy):
         """Test API client configuration failure."""
         with patch('fyn_api_client.ApiClient', side_effect=Exception("Config error")):
@@ -242,8 +305,9 @@ class TestServerProxy:
         server_proxy.logger.debug.assert_called_once()
         server_proxy._runner_api.runner_manager_runner_partial_update.assert_called_once_with(
             id=server_proxy.id,
-            patched_runner_info_request=ANY
+            patched_runner_info_request=server_proxy._status_requests[fac.StateEnum.ID]
         )
+        assert server_proxy._status_requests[fac.StateEnum.ID].state == fac.StateEnum.ID
 
     def test_report_status_failure(self, server_proxy):
         """Test status reporting failure."""
@@ -260,23 +324,13 @@ class TestServerProxy:
         """Test WebSocket URL construction logic."""
         # Test HTTPS to WSS conversion
         server_proxy.api_config.host = "https://api.example.com:8443"
-
-        # Extract URL construction logic from _receive_handler
-        protocol, url, port = server_proxy.api_config.host.split(":")
-        protocol = "ws:" if protocol == "http" else "wss:"
-        ws_url = f"{protocol}{url}:{port}/ws/runner_manager/{server_proxy.id}"
-
         expected_url = f"wss://api.example.com:8443/ws/runner_manager/{server_proxy.id}"
-        assert ws_url == expected_url
+        assert server_proxy._build_ws_url() == expected_url
 
         # Test HTTP to WS conversion
         server_proxy.api_config.host = "http://localhost:8000"
-        protocol, url, port = server_proxy.api_config.host.split(":")
-        protocol = "ws:" if protocol == "http" else "wss:"
-        ws_url = f"{protocol}{url}:{port}/ws/runner_manager/{server_proxy.id}"
-
         expected_url = f"ws://localhost:8000/ws/runner_manager/{server_proxy.id}"
-        assert ws_url == expected_url
+        assert server_proxy._build_ws_url() == expected_url
 
     def test_handle_ws_message_valid(self, server_proxy):
         """Test handling a valid WebSocket message."""
@@ -304,6 +358,176 @@ class TestServerProxy:
         assert sent_response["response_to"] == "msg-123"
         assert sent_response["status"] == "processed"
 
+    def test_handle_ws_message_invalid_json(self, server_proxy):
+        """Test malformed frames raise the standard JSON decode error."""
+        server_proxy._observers["test_message"] = MagicMock()
+
+        with pytest.raises(json.JSONDecodeError):
+            server_proxy._handle_ws_message(server_proxy._ws, '{"id": "msg-123", "type": ')
+
+        server_proxy._observers["test_message"].assert_not_called()
+
+    def test_handle_ws_message_dispatches_to_pool(self, server_proxy):
+        """Test observer callbacks are submitted to the callback pool, not run on the WS thread."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        mock_callback = MagicMock(return_value=None)
+        server_proxy._observers["test_message"] = mock_callback
+        server_proxy._callback_pool = MagicMock()
+
+        server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                      "type": "test_message"}))
+
+        server_proxy._callback_pool.submit.assert_called_once_with(
+            mock_callback, {"id": "msg-123", "type": "test_message"})
+        server_proxy._callback_pool.submit.return_value.add_done_callback.assert_called_once()
+        mock_callback.assert_not_called()
+        server_proxy._ws.send.assert_not_called()
+
+    def test_handle_ws_message_backpressure(self, server_proxy):
+        """Test messages are rejected once the pending callback limit is reached."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        mock_callback = MagicMock(return_value=None)
+        server_proxy._observers["test_message"] = mock_callback
+        server_proxy._callback_slots = threading.BoundedSemaphore(1)
+        server_proxy._callback_slots.acquire()  # one callback already pending
+
+        with patch.object(ServerProxy, '_CALLBACK_SLOT_TIMEOUT', 0.01):
+            server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                          "type": "test_message"}))
+
+        mock_callback.assert_not_called()
+        server_proxy.logger.error.assert_called_once()
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response["type"] == "error"
+        assert sent_response["data"] == ServerProxy._ERR_BUSY
+
+    def test_handle_ws_message_releases_callback_slot(self, server_proxy):
+        """Test the pending callback slot is freed once the callback has been answered."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._observers["test_message"] = MagicMock(side_effect=Exception("failed"))
+        server_proxy._callback_slots = threading.BoundedSemaphore(1)
+
+        for _ in range(2):
+            server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                          "type": "test_message"}))
+
+        assert server_proxy._observers["test_message"].call_count == 2
+        assert server_proxy._callback_slots.acquire(blocking=False)
+
+    def test_handle_ws_message_on_callback_pool(self, server_proxy):
+        """Test the response is sent from a pool thread and its slot freed, with a real pool."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._callback_slots = threading.BoundedSemaphore(1)
+        server_proxy._callback_pool = ThreadPoolExecutor(max_workers=1,
+                                                         thread_name_prefix="ws-callback")
+        sent = threading.Event()
+        sender_threads = []
+
+        def record_send(*_):
+            sender_threads.append(threading.current_thread().name)
+            sent.set()
+
+        def callback(_):
+            dispatched.wait(timeout=5.0)  # still running when the done callback is attached
+            return {"status": "ok"}
+
+        dispatched = threading.Event()
+        server_proxy._ws.send.side_effect = record_send
+        server_proxy._observers["test_message"] = callback
+
+        try:
+            server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                          "type": "test_message"}))
+            dispatched.set()
+            assert sent.wait(timeout=5.0)
+        finally:
+            server_proxy._callback_pool.shutdown(wait=True)
+
+        assert sender_threads[0].startswith("ws-callback")
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response == {"status": "ok", "response_to": "msg-123"}
+        assert server_proxy._callback_slots.acquire(blocking=False)
+
+    def test_stopping_cancels_queued_callbacks(self, server_proxy):
+        """Test clearing running cancels queued callbacks, frees their slots and closes the WS."""
+        ws = MagicMock()
+        server_proxy._ws = ws
+        server_proxy._ws_connected = True
+        server_proxy._callback_slots = threading.BoundedSemaphore(2)
+        server_proxy._callback_pool = ThreadPoolExecutor(max_workers=1,
+                                                         thread_name_prefix="ws-callback")
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_callback(message):
+            if message["id"] == "msg-1":
+                started.set()
+                release.wait(timeout=5.0)
+
+        server_proxy._observers["test_message"] = MagicMock(side_effect=blocking_callback)
+
+        try:
+            for message_id in ("msg-1", "msg-2"):
+                server_proxy._handle_ws_message(ws, json.dumps({"id": message_id,
+                                                                "type": "test_message"}))
+            assert started.wait(timeout=5.0)
+
+            server_proxy.running = False
+            ws.close.assert_called_once()
+
+            # the queued callback was cancelled and answered nothing, but freed its slot
+            assert server_proxy._callback_slots.acquire(blocking=False)
+        finally:
+            release.set()
+            server_proxy._callback_pool.shutdown(wait=True)
+
+        # the callback already running still completed and was answered
+        assert server_proxy._observers["test_message"].call_count == 1
+        ws.send.assert_called_once()
+        assert json.loads(ws.send.call_args[0][0])["response_to"] == "msg-1"
+        assert server_proxy._callback_slots.acquire(blocking=False)
+
+    def test_handle_ws_message_rich_response(self, server_proxy):
+        """Test observer responses with datetimes and dataclasses serialise as-is."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+
+        @dataclasses.dataclass
+        class Result:
+            """Observer result payload."""
+            count: int
+
+        server_proxy._observers["test_message"] = MagicMock(return_value={
+            "when": datetime.datetime(2025, 1, 2, 3, 4, 5),
+            "result": Result(count=3)
+        })
+
+        server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                      "type": "test_message"}))
+
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response == {"when": "2025-01-02T03:04:05+00:00",
+                                 "result": {"count": 3},
+                                 "response_to": "msg-123"}
+
+    def test_handle_ws_message_non_str_keys(self, server_proxy):
+        """Test observer responses with non-string dict keys serialise as json.dumps did."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._observers["test_message"] = MagicMock(return_value={
+            "counts": {1: "one", 2.5: "two and a half"}
+        })
+
+        server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                      "type": "test_message"}))
+
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response == {"counts": {"1": "one", "2.5": "two and a half"},
+                                 "response_to": "msg-123"}
+
     @pytest.mark.parametrize("message_data,expected_error", [
         # Message without ID
         ({"type": "test_message", "data": {"key": "value"}}, "no id"),
@@ -393,12 +617,12 @@ class TestServerProxy:
         server_proxy._on_ws_close(MagicMock(), 1000, "Normal closure")
         assert server_proxy._ws_connected is False
         server_proxy.logger.info.assert_called_with(
-            "WebSocket connection closed: 1000 Normal closure")
+            "WebSocket connection closed: %s %s", 1000, "Normal closure")
 
         # Test error callback
         error = Exception("Test WebSocket error")
         server_proxy._on_ws_error(MagicMock(), error)
-        server_proxy.logger.error.assert_called_with("WebSocket error: Test WebSocket error")
+        server_proxy.logger.error.assert_called_with("WebSocket error: %s", error)
 
     @pytest.mark.parametrize("connected,send_exception,should_send", [
         (True, None, True),  # Connected, no exception
@@ -420,9 +644,8 @@ class TestServerProxy:
             if send_exception:
                 # Should log error about failed send
                 server_proxy.logger.error.assert_called_once()
-                log_message = server_proxy.logger.error.call_args[0][0]
-                assert "Failed to send error response" in log_message
-                assert str(send_exception) in log_message
+                log_args = server_proxy.logger.error.call_args.args
+                assert log_args == ("Failed to send error response: %s", send_exception)
             else:
                 # Should send proper error response
                 sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
@@ -437,226 +660,251 @@ class TestServerProxy:
                 "Cannot send error response: WebSocket not connected"
             )
 
-    def test_receive_handler_reconnection_logic(self, server_proxy):
-        """Test WebSocket reconnection logic in receive handler."""
+    def test_handle_ws_message_error_skips_connection_check(self, server_proxy):
+        """Test receive-thread error responses are sent without re-checking connection state."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = False  # would make _ws_error_response refuse to send
 
-        server_proxy.api_config.host = "http://localhost:8000"
+        server_proxy._handle_ws_message(server_proxy._ws, json.dumps({"id": "msg-123",
+                                                                      "type": "unknown_type"}))
 
-        with (patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app,
-              patch('fyn_runner.server.server_proxy.time.sleep') as mock_sleep):
+        server_proxy._ws.send.assert_called_once()
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response["type"] == "error"
+        assert sent_response["response_to"] == "msg-123"
 
-            # Track calls to run_forever
-            call_count = 0
+    def test_ws_error_response_escapes_data(self, server_proxy):
+        """Test the templated error response stays valid JSON for awkward strings."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        data = 'bad "value"\n\\ with ünicode'
 
-            def mock_ws_factory(*_, **__):
-                nonlocal call_count
-                call_count += 1
-                mock_ws_instance = MagicMock()
+        server_proxy._ws_error_response('msg-"123"', data)
 
-                def mock_run_forever():
-                    if call_count == 1:
-                        # First call: simulate connection lost, return to trigger reconnection
-                        return
-                    # Second call: just wait for running to be set to False
-                    while server_proxy.running:
-                        time.sleep(0.01)
+        payload, opcode = server_proxy._ws.send.call_args[0]
+        assert isinstance(payload, bytes)
+        assert opcode == ABNF.OPCODE_TEXT
+        assert json.loads(payload) == {"type": "error", "response_to": 'msg-"123"', "data": data}
 
-                mock_ws_instance.run_forever.side_effect = mock_run_forever
-                return mock_ws_instance
+    def test_handle_ws_message_numeric_id(self, server_proxy):
+        """Test non-string message ids are echoed back in success and error responses."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._observers["test_message"] = MagicMock(return_value=None)
 
-            mock_ws_app.side_effect = mock_ws_factory
+        server_proxy._handle_ws_message(server_proxy._ws, '{"id": 42, "type": "test_message"}')
 
-            # Start the handler in a separate thread
-            server_proxy.running = True
-            handler_thread = threading.Thread(target=server_proxy._receive_handler)
-            handler_thread.daemon = True
-            handler_thread.start()
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response == {"type": "success", "response_to": 42}
 
-            # Wait for reconnection logic to trigger
-            time.sleep(0.2)
+        server_proxy._handle_ws_message(server_proxy._ws, '{"id": 43}')
 
-            # Stop the handler
-            server_proxy.running = False
-            handler_thread.join(timeout=1.0)
+        sent_response = json.loads(server_proxy._ws.send.call_args[0][0])
+        assert sent_response == {"type": "error", "response_to": 43,
+                                 "data": ServerProxy._ERR_MISSING_TYPE}
 
-            # Verify reconnection attempt
-            assert mock_ws_app.call_count == 2  # Initial + reconnect
-            server_proxy.logger.warning.assert_called_with(
-                "WebSocket disconnected, reconnecting...")
-            # Check that sleep was called with 5 seconds (reconnection delay)
-            assert any(call[0][0] == 5 for call in mock_sleep.call_args_list)
+    def test_ws_send_circuit_breaker_trips(self, server_proxy):
+        """Test consecutive send failures open the breaker and further sends are dropped."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._ws.send.side_effect = Exception("Send failed")
 
-    def test_receive_handler_exception_handling(self, server_proxy):
-        """Test exception handling in receive handler."""
+        for _ in range(ServerProxy._SEND_BREAKER_THRESHOLD):
+            server_proxy._ws_error_response("msg-123", "Test error message")
 
-        server_proxy.api_config.host = "http://localhost:8000"
+        assert server_proxy._ws.send.call_count == ServerProxy._SEND_BREAKER_THRESHOLD
+        assert server_proxy._ws_send_blocked_until > time.monotonic()
 
-        with patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app:
+        server_proxy._ws_error_response("msg-456", "Test error message")
+        assert server_proxy._ws.send.call_count == ServerProxy._SEND_BREAKER_THRESHOLD
+        server_proxy.logger.warning.assert_called_with(ServerProxy._DROPPED_RESPONSE, "msg-456")
 
-            # First call raises exception, second call succeeds
-            call_count = 0
+        # A new connection closes the breaker
+        server_proxy._on_ws_open(MagicMock())
+        server_proxy._ws.send.side_effect = None
+        server_proxy._ws_error_response("msg-123", "Test error message")
+        assert server_proxy._ws.send.call_count == ServerProxy._SEND_BREAKER_THRESHOLD + 1
 
-            def mock_ws_app_side_effect(*_, **__):
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    raise RuntimeError("WebSocket creation failed")
-                mock_ws_instance = MagicMock()
-                # Second call: wait for running to be set to False
+    def test_ws_send_circuit_breaker_drops_success_response(self, server_proxy):
+        """Test a callback response dropped by the open breaker is logged."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._ws_send_blocked_until = time.monotonic() + 60.0
+        server_proxy._observers["test_message"] = MagicMock(return_value=None)
 
-                def mock_run_forever():
-                    while server_proxy.running:
-                        time.sleep(0.01)
-                mock_ws_instance.run_forever.side_effect = mock_run_forever
-                return mock_ws_instance
+        server_proxy._handle_ws_message(server_proxy._ws,
+                                        '{"id": "msg-123", "type": "test_message"}')
 
-            mock_ws_app.side_effect = mock_ws_app_side_effect
+        server_proxy._ws.send.assert_not_called()
+        server_proxy.logger.warning.assert_called_with(ServerProxy._DROPPED_RESPONSE, "msg-123")
+        server_proxy.logger.info.assert_not_called()
 
-            # Start the handler in a separate thread
-            server_proxy.running = True
-            handler_thread = threading.Thread(target=server_proxy._receive_handler)
-            handler_thread.daemon = True
-            handler_thread.start()
+    def test_ws_send_circuit_breaker_resets_on_success(self, server_proxy):
+        """Test a successful send clears the consecutive failure count."""
+        server_proxy._ws = MagicMock()
+        server_proxy._ws_connected = True
+        server_proxy._ws.send.side_effect = \
+            [Exception("Send failed")] * (ServerProxy._SEND_BREAKER_THRESHOLD - 1) + [None]
 
-            # Wait a bit for the error handling to trigger
-            time.sleep(0.1)
+        for _ in range(ServerProxy._SEND_BREAKER_THRESHOLD):
+            server_proxy._ws_error_response("msg-123", "Test error message")
 
-            # Stop the handler
-            server_proxy.running = False
-            handler_thread.join(timeout=1.0)
+        assert server_proxy._ws_send_failures == 0
+        assert server_proxy._ws_send_blocked_until == 0.0
 
-            # Verify error handling
-            server_proxy.logger.error.assert_called_with(
-                "WebSocket error: WebSocket creation failed")
+    def test_receive_handler_reconnection_logic(self, server_proxy):
+        """Test a dropped connection is followed by a jittered reconnect delay."""
+        with (patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app,
+              patch('fyn_runner.server.server_proxy.time.sleep') as mock_sleep):
 
-    def test_websocket_header_configuration(self, server_proxy):
-        """Test WebSocket header configuration with token."""
+            server_proxy._run_ws_once("ws://localhost:8000/ws/runner_manager/test-123")
 
-        server_proxy.api_config.host = "http://localhost:8000"
+            mock_ws_app.return_value.run_forever.assert_called_once()
+            server_proxy.logger.warning.assert_called_with(
+                "WebSocket disconnected, reconnecting...")
+            # Check that the first reconnection delay was the jittered base delay
+            base, jitter = ServerProxy._RECONNECT_BASE_DELAY, ServerProxy._RECONNECT_JITTER
+            mock_sleep.assert_called_once()
+            assert base * (1 - jitter) <= mock_sleep.call_args[0][0] <= base * (1 + jitter)
+
+    def test_reconnect_delay_backoff(self, server_proxy):
+        """Test reconnect delays grow exponentially and are capped."""
+        with patch('fyn_runner.server.server_proxy.random.uniform', return_value=1.0):
+            delays = [server_proxy._reconnect_delay() for _ in range(8)]
+
+        assert delays[:3] == [0.5, 1.0, 2.0]
+        assert delays[-1] == ServerProxy._RECONNECT_MAX_DELAY
+
+    @pytest.mark.parametrize("uptime, expected_attempts", [
+        (0.1, 4),  # accepted then dropped: keep backing off
+        (ServerProxy._RECONNECT_RESET_AFTER, 1),  # stable connection: start over
+    ])
+    def test_reconnect_backoff_reset_requires_stable_connection(self, server_proxy, uptime,
+                                                                 expected_attempts):
+        """Test the backoff only resets after a connection has stayed open long enough."""
+        server_proxy._ws_reconnect_attempts = 3
 
-        with patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app:
+        with (patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app,
+              patch('fyn_runner.server.server_proxy.time.sleep'),
+              patch('fyn_runner.server.server_proxy.time.monotonic',
+                    side_effect=[100.0, 100.0 + uptime])):
+            mock_ws_app.return_value.run_forever.side_effect = \
+                lambda: server_proxy._on_ws_open(mock_ws_app.return_value)
 
-            mock_ws_instance = MagicMock()
-            mock_ws_app.return_value = mock_ws_instance
+            server_proxy._run_ws_once("ws://localhost:8000/ws/runner_manager/test-123")
 
-            # Mock run_forever to wait for running to be set to False
-            def mock_run_forever():
-                while server_proxy.running:
-                    time.sleep(0.01)
-            mock_ws_instance.run_forever.side_effect = mock_run_forever
+        # the attempt count includes the delay taken before the next reconnect
+        assert server_proxy._ws_reconnect_attempts == expected_attempts
 
-            # Start the handler in a separate thread
-            server_proxy.running = True
-            handler_thread = threading.Thread(target=server_proxy._receive_handler)
-            handler_thread.daemon = True
-            handler_thread.start()
+    def test_reconnect_delay_jitter(self, server_proxy):
+        """Test reconnect delays are jittered within the configured fraction."""
+        server_proxy._ws_reconnect_attempts = 3
 
-            # Wait a bit for the WebSocket to be created
-            time.sleep(0.1)
+        with patch('fyn_runner.server.server_proxy.random.uniform') as mock_uniform:
+            mock_uniform.return_value = 1.25
+            delay = server_proxy._reconnect_delay()
 
-            # Stop the handler
-            server_proxy.running = False
-            handler_thread.join(timeout=1.0)
+        mock_uniform.assert_called_once_with(0.75, 1.25)
+        assert delay == 4.0 * 1.25
+
+    def test_receive_handler_exception_handling(self, server_proxy):
+        """Test exception handling in receive handler."""
+        with (patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app,
+              patch('fyn_runner.server.server_proxy.time.sleep') as mock_sleep):
+            mock_ws_app.side_effect = RuntimeError("WebSocket creation failed")
+
+            server_proxy._run_ws_once("ws://localhost:8000/ws/runner_manager/test-123")
+
+            # Verify error handling
+            log_format, error = server_proxy.logger.error.call_args.args
+            assert log_format == "WebSocket error: %s"
+            assert str(error) == "WebSocket creation failed"
+            mock_sleep.assert_called_once()
+
+    def test_websocket_header_configuration(self, server_proxy):
+        """Test WebSocket header configuration with token."""
+        server_proxy.running = False
+
+        with patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app:
+            server_proxy._run_ws_once("ws://localhost:8000/ws/runner_manager/test-123")
 
             # Verify WebSocket was created with correct headers
             mock_ws_app.assert_called_once()
             call_args = mock_ws_app.call_args
-            assert 'header' in call_args[1]
+            assert call_args[0][0] == "ws://localhost:8000/ws/runner_manager/test-123"
             assert call_args[1]['header']['token'] == server_proxy.token
+            assert call_args[1]['header'] is server_proxy._ws_header
 
     def test_shutdown_behavior(self, server_proxy):
         """Test that setting running to False stops the WebSocket handler."""
+        server_proxy.running = True
 
-        server_proxy.api_config.host = "http://localhost:8000"
+        def stop_after_second(_):
+            if server_proxy._run_ws_once.call_count == 2:
+                server_proxy.running = False
 
-        with patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app:
-
-            mock_ws_instance = MagicMock()
-            mock_ws_app.return_value = mock_ws_instance
-
-            # Mock run_forever to wait for running to be set to False
-            def mock_run_forever():
-                while server_proxy.running:
-                    time.sleep(0.01)
-            mock_ws_instance.run_forever.side_effect = mock_run_forever
-
-            # Start the handler in a separate thread
-            server_proxy.running = True
-            handler_thread = threading.Thread(target=server_proxy._receive_handler)
-            handler_thread.daemon = True
-            handler_thread.start()
-
-            # Wait a bit for the WebSocket to be created
-            time.sleep(0.1)
+        with patch.object(server_proxy, '_run_ws_once', side_effect=stop_after_second):
+            server_proxy._receive_handler()
 
-            # Stop the handler
-            server_proxy.running = False
-            handler_thread.join(timeout=1.0)
-
-            # Verify the thread stopped gracefully
-            assert not handler_thread.is_alive()
-
-            # Should only call WebSocket once since we stopped cleanly
-            assert mock_ws_app.call_count == 1
+            # One connection per iteration, and none after running was cleared
+            assert server_proxy._run_ws_once.call_count == 2
+            server_proxy._run_ws_once.assert_called_with(
+                "ws://localhost:8000/ws/runner_manager/test-123")
 
-    def test_websocket_error_handling_during_creation(self, server_proxy):
-        """Test error handling when WebSocketApp creation fails."""
-
-        server_proxy.api_config.host = "http://localhost:8000"
+    def test_clean_close_when_stopped(self, server_proxy):
+        """Test a connection closed after shutdown neither warns nor backs off."""
+        server_proxy.running = False
+        server_proxy.logger.reset_mock()
 
-        with patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app:
+        with (patch('fyn_runner.server.server_proxy.WebSocketApp') as mock_ws_app,
+              patch('fyn_runner.server.server_proxy.time.sleep') as mock_sleep):
+            server_proxy._run_ws_once("ws://localhost:8000/ws/runner_manager/test-123")
 
-            # Set up to raise error on first call, succeed on second
-            call_count = 0
+            mock_ws_app.return_value.run_forever.assert_called_once()
+            server_proxy.logger.warning.assert_not_called()
+            mock_sleep.assert_not_called()
 
-            def side_effect_counter(*_, **__):
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    raise RuntimeError("WebSocket creation failed")
-                mock_ws_instance = MagicMock()
-                # Second call: wait for running to be set to False
+    def test_finalizer_registration(self, server_proxy):
+        """Test that offline reporting is registered with a weakref finalizer run at exit."""
 
-                def mock_run_forever():
-                    while server_proxy.running:
-                        time.sleep(0.01)
-                mock_ws_instance.run_forever.side_effect = mock_run_forever
-                return mock_ws_instance
+        assert server_proxy._finalizer.alive
+        assert server_proxy._finalizer.atexit
 
-            mock_ws_app.side_effect = side_effect_counter
+        server_proxy._finalizer()
 
-            # Start the handler in a separate thread
-            server_proxy.running = True
-            handler_thread = threading.Thread(target=server_proxy._receive_handler)
-            handler_thread.daemon = True
-            handler_thread.start()
+        assert not server_proxy._finalizer.alive
+        server_proxy._runner_api.runner_manager_runner_partial_update.assert_called_once_with(
+            id=server_proxy.id,
+            patched_runner_info_request=server_proxy._status_requests[fac.StateEnum.OF]
+        )
 
-            # Wait a bit for the error handling to trigger
-            time.sleep(0.1)
+    def test_finalizer_holds_no_proxy_reference(self, mock_logger, mock_file_manager,
+                                                mock_configuration):
+        """Test the finalizer itself holds no reference to the proxy.
+
+        In production the started receive thread keeps the proxy alive until exit; with it cleared
+        the proxy is collectable, showing the finalizer does not pin it.
+        """
+        server_proxy = _make_server_proxy(mock_logger, mock_file_manager, mock_configuration)
+        runner_api = server_proxy._runner_api
+        finalizer = server_proxy._finalizer
+        server_proxy._thread_instances.clear()  # the un-started thread references the proxy
+        server_proxy._ws_thread = None
+
+        del server_proxy
+        gc.collect()
+
+        assert not finalizer.alive
+        runner_api.runner_manager_runner_partial_update.assert_called_once()
+
+    def test_cleanup_report_failure(self):
+        """Test a failed offline report during cleanup is logged rather than raised."""
+        logger = MagicMock(spec=logging.Logger)
+        runner_api = MagicMock()
+        runner_api.runner_manager_runner_partial_update.side_effect = \
+            requests.exceptions.RequestException("Connection failed")
 
-            # Stop the handler
-            server_proxy.running = False
-            handler_thread.join(timeout=1.0)
+        ServerProxy._cleanup(logger, runner_api, "test-123",
+                             fac.PatchedRunnerInfoRequest(state=fac.StateEnum.OF))
 
-            # Should have logged the error
-            server_proxy.logger.error.assert_called_with(
-                "WebSocket error: WebSocket creation failed")
-
-    def test_atexit_registration(self, mock_logger, mock_file_manager, mock_configuration):
-        """Test that cleanup is registered with atexit."""
-        with (patch('atexit.register') as mock_register,
-              patch('threading.Thread'),
-              patch('fyn_api_client.Configuration'),
-              patch('fyn_api_client.ApiClient'),
-              patch('fyn_api_client.RunnerManagerApi'),
-              patch.object(ServerProxy, '_report_status')):
-
-            ServerProxy(mock_logger, mock_file_manager, mock_configuration)
-
-            # Should register cleanup with atexit
-            mock_register.assert_called_once_with(ANY, fac.StateEnum.OF)
-
-            # The first argument should be the _report_status method
-            call_args = mock_register.call_args[0]
-            assert len(call_args) == 2
-            assert call_args[1] == fac.StateEnum.OF
\ No newline at end of file
+        logger.error.assert_called_once()